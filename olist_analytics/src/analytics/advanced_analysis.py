@@ -22,7 +22,7 @@ class AdvancedAnalyzer:
         print("=" * 80)
         
         # Overall distribution
-        segment_stats = rfm_df.groupby('segment').agg({
+        segment_stats = rfm_df.groupby('segment', observed=True).agg({
             'customer_id': 'count',
             'recency': ['mean', 'median', 'std'],
             'frequency': ['mean', 'median', 'std'],
@@ -229,7 +229,7 @@ class AdvancedAnalyzer:
         print("=" * 80)
         
         # Payment type analysis
-        payment_analysis = payments_df.groupby('payment_type').agg({
+        payment_analysis = payments_df.groupby('payment_type', observed=True).agg({
             'payment_value': ['count', 'sum', 'mean', 'median', 'std'],
             'payment_installments': ['mean', 'median']
         }).round(2)
@@ -0,0 +1,10 @@
+"""
+Column dtypes for the Olist sample CSVs
+Shared by the analysis scripts' loaders and the test fixtures
+"""
+
+# Explicit dtypes skip inference; low-cardinality labels load as categoricals
+ORDERS_DTYPES = {'order_status': 'category'}
+ORDERS_DATE_COLUMNS = ['order_purchase_timestamp', 'order_delivered_carrier_date', 'order_delivered_customer_date']
+PAYMENTS_DTYPES = {'payment_type': 'category', 'payment_sequential': 'int16', 'payment_installments': 'int16'}
+CUSTOMERS_DTYPES = {'customer_state': 'category', 'customer_city': 'category', 'customer_zip_code_prefix': 'int32'}
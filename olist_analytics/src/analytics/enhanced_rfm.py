@@ -404,7 +404,7 @@ class EnterpriseRFMAnalyzer:
         """Generate comprehensive segment summary"""
         logger.logger.info("Generating segment summary")
         
-        summary = segments_df.groupby('segment').agg({
+        summary = segments_df.groupby('segment', observed=True).agg({
             'customer_id': 'count',
             'recency': ['mean', 'median'],
             'frequency': ['mean', 'median'],
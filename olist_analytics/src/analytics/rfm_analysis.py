@@ -94,7 +94,7 @@ class RFMAnalyzer:
     
     def get_segment_summary(self, rfm_df):
         """Quick segment summary"""
-        summary = rfm_df.groupby('segment').agg({
+        summary = rfm_df.groupby('segment', observed=True).agg({
             'customer_id': 'count',
             'monetary': ['mean', 'sum']
         }).round(2)
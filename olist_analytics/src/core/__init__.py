@@ -1,10 +1,17 @@
 """Core infrastructure components for Olist Analytics"""
 
+import importlib
+
 from .config import config
 from .logging import get_logger
 from .exceptions import OlistAnalyticsError, DataValidationError, ConfigurationError
 from .cache import CacheManager
-from .metrics import MetricsCollector
+
+# Imported on first attribute access (PEP 562): metrics.py is deployed with the monitoring
+# service, so the rest of core stays importable where it is absent
+_LAZY_IMPORTS = {
+    'MetricsCollector': '.metrics'
+}
 
 __all__ = [
     'config',
@@ -14,4 +21,19 @@ __all__ = [
     'ConfigurationError',
     'CacheManager',
     'MetricsCollector'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
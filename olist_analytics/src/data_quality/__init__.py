@@ -1,8 +1,17 @@
 """Data quality and validation components"""
 
-from .validator import DataValidator, ValidationResult
-from .schemas import OrderSchema, PaymentSchema, CustomerSchema
-from .profiler import DataProfiler
+import importlib
+
+# Submodules are imported on first attribute access (PEP 562), so importing the
+# package for one component doesn't pay for the others
+_LAZY_IMPORTS = {
+    'DataValidator': '.validator',
+    'ValidationResult': '.validator',
+    'OrderSchema': '.schemas',
+    'PaymentSchema': '.schemas',
+    'CustomerSchema': '.schemas',
+    'DataProfiler': '.profiler'
+}
 
 __all__ = [
     'DataValidator',
@@ -11,4 +20,19 @@ __all__ = [
     'PaymentSchema',
     'CustomerSchema',
     'DataProfiler'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -3,15 +3,72 @@
 import pandas as pd
 import numpy as np
 from typing import List, Dict, Any, Optional, Union, Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import cached_property
+import os
 import re
+import threading
+import warnings
 
 from ..core.exceptions import DataValidationError
 from ..core.logging import get_logger
 
+# PyArrow is optional - PatternRule uses its RE2 engine when present
+try:
+    import pyarrow  # noqa: F401
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 logger = get_logger(__name__)
 
+# Compiled regexes shared by every PatternRule built from the same pattern string
+_PATTERN_CACHE: Dict[str, re.Pattern] = {}
+
+def _compile_pattern(pattern: str) -> re.Pattern:
+    """Compile a regex once per process"""
+    compiled = _PATTERN_CACHE.get(pattern)
+    if compiled is None:
+        compiled = _PATTERN_CACHE[pattern] = re.compile(pattern)
+    return compiled
+
+# Syntax Python re and RE2 treat alike: literals, escaped ASCII punctuation, '.', plain groups,
+# simple [...] sets (no nested '[' - so no POSIX [:classes:]), *, +, ? and bounded {m} / {m,n}
+# repeats (optionally lazy), '|', '^' and '$'. \w, \d, \s and \b are ASCII-only in RE2, so every
+# letter/digit escape stays on Python re, as do flags, lookarounds and backreferences
+_RE2_PUNCT = r'\\[!-/:-@\[-`{-~]'
+_RE2_SAFE = re.compile(
+    r'(?:(?:' + _RE2_PUNCT + r'|\[\^?(?:' + _RE2_PUNCT + r'|[^\\\[\]])+\]|\((?!\?)|\)|[^\\\[\]{}()*+?|^$])'
+    r'(?:(?:[*+?]|\{\d+(?:,\d+)?\})\??)?|[|^$])*'
+)
+
+def _arrow_pattern(pattern: str) -> Optional[str]:
+    """RE2 spelling of pattern if it matches exactly like Python re, otherwise None"""
+    if not _RE2_SAFE.fullmatch(pattern):
+        return None
+    # Python's $ also matches before a trailing newline; RE2's only at the very end.
+    # A single final $ is spelled out, anything else stays on Python re
+    if '$' in pattern:
+        if pattern.count('$') > 1 or not pattern.endswith('$') or pattern.endswith('\\$'):
+            return None
+        pattern = pattern[:-1] + '\n?$'
+    # Anchor the whole pattern: older pandas only prefixes '^', which leaves a top-level '|' unanchored
+    return f'^(?:{pattern})'
+
+# Type mapping for common cases: dtype name -> accepted expected_type aliases
+_TYPE_MAPPING = {
+    'object': ['string', 'str', 'text'],
+    'int64': ['int', 'integer'],
+    'float64': ['float', 'numeric', 'decimal'],
+    'datetime64[ns]': ['datetime', 'timestamp'],
+    'bool': ['boolean']
+}
+
+# Flattened alias -> dtype name lookup (aliases are unique across dtypes)
+_ALIAS_TO_DTYPE = {alias: dtype for dtype, aliases in _TYPE_MAPPING.items() for alias in [dtype, *aliases]}
+
 @dataclass
 class ValidationResult:
     """Result of data validation"""
@@ -19,54 +76,163 @@ class ValidationResult:
     errors: List[str] = field(default_factory=list)
     warnings: List[str] = field(default_factory=list)
     metrics: Dict[str, Any] = field(default_factory=dict)
+    # Where the current rule's errors start, for rules that share one result
+    _rule_start: int = field(default=0, init=False, repr=False, compare=False)
+    
+    # Error messages kept per rule; the rest are only counted in metrics['truncated_errors']
+    MAX_SAMPLE_ERRORS = 10
     
     def add_error(self, message: str):
         """Add validation error"""
-        self.errors.append(message)
         self.is_valid = False
+        if len(self.errors) - self._rule_start >= self.MAX_SAMPLE_ERRORS:
+            self.metrics['truncated_errors'] = self.metrics.get('truncated_errors', 0) + 1
+            return
+        self.errors.append(message)
         
     def add_warning(self, message: str):
         """Add validation warning"""
         self.warnings.append(message)
         
+    def start_rule(self):
+        """Begin a new rule's error sample when several rules write into this result"""
+        self._rule_start = len(self.errors)
+        
     def merge(self, other: 'ValidationResult'):
         """Merge another validation result"""
         if not other.is_valid:
             self.is_valid = False
         self.errors.extend(other.errors)
         self.warnings.extend(other.warnings)
-        self.metrics.update(other.metrics)
+        self.merge_metrics(other.metrics)
+        
+    def merge_metrics(self, metrics: Dict[str, Any]):
+        """Update metrics, adding up truncated error counts rather than overwriting them"""
+        truncated = self.metrics.get('truncated_errors', 0) + metrics.get('truncated_errors', 0)
+        self.metrics.update(metrics)
+        if truncated:
+            self.metrics['truncated_errors'] = truncated
+
+@dataclass
+class ColumnContext:
+    """One column's derived views, each computed on first use and shared by every rule on the column"""
+    column: str
+    series: pd.Series
+    n: int
+    
+    @cached_property
+    def isnull_mask(self) -> pd.Series:
+        return self.series.isnull()
+    
+    @cached_property
+    def null_count(self) -> int:
+        dtype = self.series.dtype
+        if isinstance(dtype, np.dtype):
+            # Plain NumPy columns: count straight off the buffer instead of building a mask Series
+            if dtype.kind in 'iub':
+                return 0
+            if dtype.kind == 'f':
+                return np.count_nonzero(np.isnan(self.series.to_numpy(copy=False)))
+            if dtype.kind in 'mM':
+                return np.count_nonzero(np.isnat(self.series.to_numpy(copy=False)))
+        return self.isnull_mask.sum()
+    
+    @cached_property
+    def dtype_name(self) -> str:
+        return str(self.series.dtype)
+    
+    @cached_property
+    def numeric(self) -> pd.Series:
+        return pd.to_numeric(self.series, errors='coerce')
+    
+    @cached_property
+    def numeric_values(self) -> np.ndarray:
+        """Column as a numeric ndarray - the column's own buffer when it is already int/float"""
+        dtype = self.series.dtype
+        if isinstance(dtype, np.dtype) and dtype.kind in 'iuf':
+            return self.series.to_numpy(copy=False)
+        if pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype):
+            # Nullable / Arrow numerics: NA becomes NaN
+            return self.series.to_numpy(dtype=np.float64, na_value=np.nan)
+        return self.numeric.to_numpy(dtype=np.float64, na_value=np.nan)
+    
+    @cached_property
+    def strdata(self) -> pd.Series:
+        return self.series.astype(str)
+    
+    @cached_property
+    def arrow_strings(self) -> pd.Series:
+        """Column as Arrow-backed strings with nulls kept as <NA>, the column itself when it already is one"""
+        dtype = self.series.dtype
+        if isinstance(dtype, pd.StringDtype) and dtype.storage == 'pyarrow':
+            return self.series
+        if isinstance(dtype, pd.ArrowDtype) and pd.api.types.is_string_dtype(dtype):
+            return self.series
+        return self.series.astype('string[pyarrow]')
+    
+    @cached_property
+    def str_values(self) -> np.ndarray:
+        """Column as an object array of str, reusing the column's own array when it already is one"""
+        values = self.series.to_numpy(dtype=object)
+        if pd.api.types.infer_dtype(values, skipna=False) == 'string':
+            return values
+        return self.strdata.to_numpy()
 
 class ValidationRule:
     """Base class for validation rules"""
     
+    # Relative evaluation cost; fail-fast validation runs cheaper rules first
+    cost = 2
+    
     def __init__(self, name: str, description: str, severity: str = 'error'):
         self.name = name
         self.description = description
         self.severity = severity  # 'error' or 'warning'
         
-    def validate(self, df: pd.DataFrame, column: str = None) -> ValidationResult:
-        """Validate data - to be implemented by subclasses"""
+    def validate(self, df: pd.DataFrame, column: str = None,
+                 result: Optional[ValidationResult] = None) -> ValidationResult:
+        """Validate data, adding issues to result when given - to be implemented by subclasses"""
         raise NotImplementedError
 
-class NotNullRule(ValidationRule):
-    """Validates that column values are not null"""
+class ColumnRule(ValidationRule):
+    """Base class for rules that check a single column"""
     
-    def __init__(self, column: str, max_null_percentage: float = 0.0):
-        super().__init__(f"not_null_{column}", f"Column {column} should not have null values")
+    def __init__(self, column: str, name: str, description: str, severity: str = 'error'):
+        super().__init__(name, description, severity)
         self.column = column
-        self.max_null_percentage = max_null_percentage
         
-    def validate(self, df: pd.DataFrame, column: str = None) -> ValidationResult:
-        result = ValidationResult(True)
+    def validate(self, df: pd.DataFrame, column: str = None,
+                 result: Optional[ValidationResult] = None) -> ValidationResult:
         col = column or self.column
         
         if col not in df.columns:
+            if result is None:
+                result = ValidationResult(True)
             result.add_error(f"Column {col} not found in DataFrame")
             return result
             
-        null_count = df[col].isnull().sum()
-        total_count = len(df)
+        return self.validate_cached(ColumnContext(col, df[col], len(df)), result)
+        
+    def validate_cached(self, ctx: ColumnContext, result: Optional[ValidationResult] = None) -> ValidationResult:
+        """Validate from a shared ColumnContext into result (a fresh one if None) - to be implemented by subclasses"""
+        raise NotImplementedError
+
+class NotNullRule(ColumnRule):
+    """Validates that column values are not null"""
+    
+    cost = 1
+    
+    def __init__(self, column: str, max_null_percentage: float = 0.0):
+        super().__init__(column, f"not_null_{column}", f"Column {column} should not have null values")
+        self.max_null_percentage = max_null_percentage
+        
+    def validate_cached(self, ctx: ColumnContext, result: Optional[ValidationResult] = None) -> ValidationResult:
+        if result is None:
+            result = ValidationResult(True)
+        col = ctx.column
+        
+        null_count = ctx.null_count
+        total_count = ctx.n
         null_percentage = (null_count / total_count * 100) if total_count > 0 else 0
         
         result.metrics[f'{col}_null_count'] = null_count
@@ -80,38 +246,25 @@ class NotNullRule(ValidationRule):
                 
         return result
 
-class DataTypeRule(ValidationRule):
+class DataTypeRule(ColumnRule):
     """Validates data types"""
     
+    cost = 0
+    
     def __init__(self, column: str, expected_type: str):
-        super().__init__(f"datatype_{column}", f"Column {column} should be of type {expected_type}")
-        self.column = column
+        super().__init__(column, f"datatype_{column}", f"Column {column} should be of type {expected_type}")
         self.expected_type = expected_type
+        # Fixed per rule, so resolve the alias once
+        self._want = _ALIAS_TO_DTYPE.get(expected_type.lower())
         
-    def validate(self, df: pd.DataFrame, column: str = None) -> ValidationResult:
-        result = ValidationResult(True)
-        col = column or self.column
+    def validate_cached(self, ctx: ColumnContext, result: Optional[ValidationResult] = None) -> ValidationResult:
+        if result is None:
+            result = ValidationResult(True)
+        col = ctx.column
         
-        if col not in df.columns:
-            result.add_error(f"Column {col} not found in DataFrame")
-            return result
-            
-        actual_type = str(df[col].dtype)
-        
-        # Type mapping for common cases
-        type_mapping = {
-            'object': ['string', 'str', 'text'],
-            'int64': ['int', 'integer'],
-            'float64': ['float', 'numeric', 'decimal'],
-            'datetime64[ns]': ['datetime', 'timestamp'],
-            'bool': ['boolean']
-        }
-        
-        is_valid_type = False
-        for dtype, aliases in type_mapping.items():
-            if actual_type.startswith(dtype) and self.expected_type.lower() in [dtype] + aliases:
-                is_valid_type = True
-                break
+        actual_type = ctx.dtype_name
+        
+        is_valid_type = self._want is not None and actual_type.startswith(self._want)
                 
         if not is_valid_type:
             result.add_error(f"Column {col} has type {actual_type}, expected {self.expected_type}")
@@ -119,62 +272,78 @@ class DataTypeRule(ValidationRule):
         result.metrics[f'{col}_actual_type'] = actual_type
         return result
 
-class RangeRule(ValidationRule):
+class RangeRule(ColumnRule):
     """Validates numeric values are within range"""
     
     def __init__(self, column: str, min_value: Optional[float] = None, max_value: Optional[float] = None):
-        super().__init__(f"range_{column}", f"Column {column} values should be within range")
-        self.column = column
+        super().__init__(column, f"range_{column}", f"Column {column} values should be within range")
         self.min_value = min_value
         self.max_value = max_value
         
-    def validate(self, df: pd.DataFrame, column: str = None) -> ValidationResult:
-        result = ValidationResult(True)
-        col = column or self.column
+    def validate_cached(self, ctx: ColumnContext, result: Optional[ValidationResult] = None) -> ValidationResult:
+        if result is None:
+            result = ValidationResult(True)
+        col = ctx.column
         
-        if col not in df.columns:
-            result.add_error(f"Column {col} not found in DataFrame")
-            return result
-            
-        numeric_data = pd.to_numeric(df[col], errors='coerce')
+        values = ctx.numeric_values
         
+        # NaN compares False both ways, so unparseable/missing values are never counted
         if self.min_value is not None:
-            below_min = numeric_data < self.min_value
-            below_min_count = below_min.sum()
+            below_min_count = np.count_nonzero(values < self.min_value)
             if below_min_count > 0:
                 result.add_error(f"Column {col} has {below_min_count} values below minimum {self.min_value}")
                 
         if self.max_value is not None:
-            above_max = numeric_data > self.max_value
-            above_max_count = above_max.sum()
+            above_max_count = np.count_nonzero(values > self.max_value)
             if above_max_count > 0:
                 result.add_error(f"Column {col} has {above_max_count} values above maximum {self.max_value}")
                 
-        result.metrics[f'{col}_min'] = numeric_data.min()
-        result.metrics[f'{col}_max'] = numeric_data.max()
-        result.metrics[f'{col}_mean'] = numeric_data.mean()
+        if values.dtype == ctx.series.dtype:
+            # The column's own int/float buffer - NumPy reductions give the Series' metric types
+            stats = _nan_stats(values)
+        else:
+            # Bool, nullable-int, datetime, ...: reduce the to_numeric Series so min/max keep its dtype
+            numeric = ctx.numeric
+            stats = numeric.min(), numeric.max(), numeric.mean()
+        result.metrics[f'{col}_min'], result.metrics[f'{col}_max'], result.metrics[f'{col}_mean'] = stats
         
         return result
 
-class PatternRule(ValidationRule):
+class PatternRule(ColumnRule):
     """Validates string patterns using regex"""
     
+    cost = 3
+    
     def __init__(self, column: str, pattern: str, description: str = None):
-        super().__init__(f"pattern_{column}", description or f"Column {column} should match pattern")
-        self.column = column
-        self.pattern = re.compile(pattern)
+        super().__init__(column, f"pattern_{column}", description or f"Column {column} should match pattern")
+        self.pattern_str = pattern
+        self.pattern = _compile_pattern(pattern)
+        # Only patterns that mean the same in RE2 take the Arrow path
+        self.arrow_pattern = _arrow_pattern(pattern) if PYARROW_AVAILABLE else None
         
-    def validate(self, df: pd.DataFrame, column: str = None) -> ValidationResult:
-        result = ValidationResult(True)
-        col = column or self.column
+    def _match(self, ctx: ColumnContext) -> np.ndarray:
+        """Boolean match mask for the column; null values never match"""
+        if self.arrow_pattern is not None:
+            try:
+                # RE2 runs over the Arrow buffer without a Python call per element
+                return ctx.arrow_strings.str.match(self.arrow_pattern, na=False).to_numpy(dtype=bool)
+            except ValueError:
+                # Syntax RE2 rejects - use Python re
+                pass
+                
+        # Bound Pattern.match straight over the ndarray - no pandas .str dispatch per element
+        matches = np.fromiter(map(self.pattern.match, ctx.str_values), dtype=bool, count=ctx.n)
+        if ctx.null_count:
+            matches &= ~ctx.isnull_mask.to_numpy()
+        return matches
         
-        if col not in df.columns:
-            result.add_error(f"Column {col} not found in DataFrame")
-            return result
-            
-        string_data = df[col].astype(str)
-        matches = string_data.str.match(self.pattern, na=False)
-        non_match_count = (~matches).sum()
+    def validate_cached(self, ctx: ColumnContext, result: Optional[ValidationResult] = None) -> ValidationResult:
+        if result is None:
+            result = ValidationResult(True)
+        col = ctx.column
+        
+        matches = self._match(ctx)
+        non_match_count = ctx.n - np.count_nonzero(matches)
         
         if non_match_count > 0:
             result.add_error(f"Column {col} has {non_match_count} values that don't match the required pattern")
@@ -184,11 +353,27 @@ class PatternRule(ValidationRule):
         
         return result
 
+def _nan_stats(values: np.ndarray) -> tuple:
+    """NaN-skipping (min, max, mean) of a 1-D array, NaN for an empty or all-NaN input"""
+    if values.size == 0:
+        return np.nan, np.nan, np.nan
+    if values.dtype.kind != 'f':
+        return values.min(), values.max(), values.mean()
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        return np.nanmin(values), np.nanmax(values), np.nanmean(values)
+
 class DataValidator:
     """Enterprise data validation framework"""
     
-    def __init__(self):
+    # Column groups run concurrently on one pool shared by all validators, created on first use
+    _executor: Optional[ThreadPoolExecutor] = None
+    _executor_lock = threading.Lock()
+    
+    def __init__(self, fail_fast: bool = False):
         self.rules: List[ValidationRule] = []
+        # Stop at the first failing rule - for callers that only need pass/fail
+        self.fail_fast = fail_fast
         
     def add_rule(self, rule: ValidationRule):
         """Add validation rule"""
@@ -219,17 +404,12 @@ class DataValidator:
         overall_result = ValidationResult(True)
         
         try:
-            for rule in self.rules:
-                rule_result = rule.validate(df)
-                overall_result.merge(rule_result)
+            # Rules write straight into the result instead of building one each to merge
+            if self.fail_fast:
+                self._run_fail_fast(df, overall_result)
+            else:
+                self._run_all(df, overall_result)
                 
-                if rule_result.errors:
-                    logger.log_data_quality_issue(
-                        rule.name,
-                        'error' if not rule_result.is_valid else 'warning',
-                        {'errors': rule_result.errors, 'warnings': rule_result.warnings}
-                    )
-                    
             duration = (datetime.now() - start_time).total_seconds()
             logger.log_analysis_complete('data_validation', duration, len(df),
                                        validation_errors=len(overall_result.errors),
@@ -237,10 +417,137 @@ class DataValidator:
                                        
         except Exception as e:
             logger.logger.error(f"Validation failed: {str(e)}")
+            # A process-level failure isn't part of any rule's error sample, so it is never capped
+            overall_result.start_rule()
             overall_result.add_error(f"Validation process failed: {str(e)}")
             
         return overall_result
     
+    @classmethod
+    def _get_executor(cls) -> ThreadPoolExecutor:
+        """Shared worker pool, built on first use"""
+        with cls._executor_lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) + 4),
+                                                   thread_name_prefix='data-validation')
+        return cls._executor
+    
+    @staticmethod
+    def _apply_rule(rule: ValidationRule, df: pd.DataFrame, ctx: Optional[ColumnContext],
+                    result: ValidationResult) -> tuple:
+        """Run one rule into result, returning the (errors, warnings) slice bounds it added"""
+        n_errors, n_warnings = len(result.errors), len(result.warnings)
+        result.start_rule()
+        if ctx is not None:
+            rule.validate_cached(ctx, result)
+        elif isinstance(rule, ColumnRule):
+            rule.validate(df, result=result)
+        else:
+            # Custom rules may predate the result argument
+            result.merge(rule.validate(df))
+        return n_errors, len(result.errors), n_warnings, len(result.warnings)
+    
+    @staticmethod
+    def _log_rule_issues(rule: ValidationRule, result: ValidationResult, span: tuple):
+        """Log the errors one rule added to result"""
+        err_start, err_end, warn_start, warn_end = span
+        if err_end > err_start:
+            logger.log_data_quality_issue(
+                rule.name,
+                'error',
+                {'errors': result.errors[err_start:err_end], 'warnings': result.warnings[warn_start:warn_end]}
+            )
+    
+    @classmethod
+    def _run_group(cls, df: pd.DataFrame, col: Optional[str], indexed_rules: List[tuple],
+                   result: ValidationResult) -> tuple:
+        """Run one column's rules into result against a shared context
+        
+        Returns the (position, span) pairs of the rules that ran, and the exception that stopped
+        the group early (None if every rule ran), so a failure doesn't discard earlier results.
+        """
+        spans = []
+        try:
+            ctx = ColumnContext(col, df[col], len(df)) if col is not None else None
+            for i, rule in indexed_rules:
+                spans.append((i, cls._apply_rule(rule, df, ctx, result)))
+        except Exception as e:
+            return spans, e
+        return spans, None
+    
+    def _run_all(self, df: pd.DataFrame, result: ValidationResult):
+        """Run every rule into result, reporting in rule order"""
+        groups = self._group_rules_by_column(df)
+        if len(groups) <= 1:
+            for col, indexed_rules in groups.items():
+                spans, error = self._run_group(df, col, indexed_rules, result)
+                for i, span in spans:
+                    self._log_rule_issues(self.rules[i], result, span)
+                if error is not None:
+                    raise error
+            return
+            
+        # One pass per column: every rule on it reads the same ColumnContext. Columns are
+        # independent and the heavy pandas/NumPy/regex work releases the GIL, so groups
+        # run in parallel, each into its own result
+        executor = self._get_executor()
+        submitted = []
+        for col, indexed_rules in groups.items():
+            group_result = ValidationResult(True)
+            submitted.append((group_result, executor.submit(self._run_group, df, col, indexed_rules, group_result)))
+            
+        # Every group is collected before any failure is raised, so the other columns'
+        # findings still reach the report
+        rule_spans: List[Optional[tuple]] = [None] * len(self.rules)
+        first_error = None
+        for group_result, future in submitted:
+            spans, error = future.result()
+            for i, span in spans:
+                rule_spans[i] = (group_result, span)
+            if error is not None and first_error is None:
+                first_error = error
+            if not group_result.is_valid:
+                result.is_valid = False
+            result.merge_metrics(group_result.metrics)
+            
+        # Stitch the groups' messages back together in rule order so the report reads the
+        # same as the rule list; rules after a failure in their group never ran
+        for rule, rule_span in zip(self.rules, rule_spans):
+            if rule_span is None:
+                continue
+            group_result, span = rule_span
+            err_start, err_end, warn_start, warn_end = span
+            result.errors.extend(group_result.errors[err_start:err_end])
+            result.warnings.extend(group_result.warnings[warn_start:warn_end])
+            self._log_rule_issues(rule, group_result, span)
+            
+        if first_error is not None:
+            raise first_error
+    
+    def _run_fail_fast(self, df: pd.DataFrame, result: ValidationResult):
+        """Run rules cheapest-first into result on the calling thread, stopping after the first failure"""
+        contexts: Dict[str, ColumnContext] = {}
+        
+        for i in sorted(range(len(self.rules)), key=lambda i: self.rules[i].cost):
+            rule = self.rules[i]
+            ctx = None
+            if isinstance(rule, ColumnRule) and rule.column in df.columns:
+                ctx = contexts.get(rule.column)
+                if ctx is None:
+                    ctx = contexts[rule.column] = ColumnContext(rule.column, df[rule.column], len(df))
+                    
+            self._log_rule_issues(rule, result, self._apply_rule(rule, df, ctx, result))
+            if not result.is_valid:
+                break
+                
+    def _group_rules_by_column(self, df: pd.DataFrame) -> Dict[Optional[str], List[tuple]]:
+        """Map each present column to its (position, rule) pairs; other rules go under None"""
+        groups: Dict[Optional[str], List[tuple]] = {}
+        for i, rule in enumerate(self.rules):
+            col = rule.column if isinstance(rule, ColumnRule) and rule.column in df.columns else None
+            groups.setdefault(col, []).append((i, rule))
+        return groups
+    
     def validate_or_raise(self, df: pd.DataFrame) -> ValidationResult:
         """Validate and raise exception if validation fails"""
         result = self.validate(df)
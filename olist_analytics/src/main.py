@@ -14,13 +14,14 @@ warnings.filterwarnings('ignore')
 from analytics.rfm_analysis import RFMAnalyzer
 from analytics.cohort_analysis import CohortAnalyzer
 from analytics.ltv_modeling import LTVPredictor
+from analytics.dtypes import ORDERS_DTYPES, ORDERS_DATE_COLUMNS, PAYMENTS_DTYPES, CUSTOMERS_DTYPES
 
 def load_data():
     """Load sample data"""
     print("📊 Loading data...")
-    orders = pd.read_csv('../data/sample_orders.csv')
-    payments = pd.read_csv('../data/sample_payments.csv')
-    customers = pd.read_csv('../data/sample_customers.csv')
+    orders = pd.read_csv('../data/sample_orders.csv', dtype=ORDERS_DTYPES, parse_dates=ORDERS_DATE_COLUMNS)
+    payments = pd.read_csv('../data/sample_payments.csv', dtype=PAYMENTS_DTYPES)
+    customers = pd.read_csv('../data/sample_customers.csv', dtype=CUSTOMERS_DTYPES)
     return orders, payments, customers
 
 def run_rfm_analysis(orders, payments):
@@ -28,13 +29,14 @@ def run_rfm_analysis(orders, payments):
     print("\n🎯 Running RFM Analysis...")
     
     # Get reference date (day after last order)
-    last_order_date = pd.to_datetime(orders['order_purchase_timestamp']).max()
+    last_order_date = orders['order_purchase_timestamp'].max()
     reference_date = last_order_date + pd.Timedelta(days=1)
     
     rfm = RFMAnalyzer(reference_date)
     rfm_df = rfm.calculate_rfm(orders, payments)
     rfm_scores = rfm.assign_scores(rfm_df)
     rfm_segments = rfm.create_segments(rfm_scores)
+    rfm_segments['segment'] = rfm_segments['segment'].astype('category')
     
     print("\n📈 RFM Segments:")
     print(rfm.get_segment_summary(rfm_segments))
@@ -6,6 +6,7 @@ Comprehensive breakdown of customer behavior and business insights
 
 import pandas as pd
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import warnings
 warnings.filterwarnings('ignore')
@@ -15,13 +16,14 @@ from analytics.rfm_analysis import RFMAnalyzer
 from analytics.cohort_analysis import CohortAnalyzer
 from analytics.ltv_modeling import LTVPredictor
 from analytics.advanced_analysis import AdvancedAnalyzer
+from analytics.dtypes import ORDERS_DTYPES, ORDERS_DATE_COLUMNS, PAYMENTS_DTYPES, CUSTOMERS_DTYPES
 
 def load_data():
     """Load sample data"""
     print("📊 Loading data...")
-    orders = pd.read_csv('../data/sample_orders.csv')
-    payments = pd.read_csv('../data/sample_payments.csv')
-    customers = pd.read_csv('../data/sample_customers.csv')
+    orders = pd.read_csv('../data/sample_orders.csv', dtype=ORDERS_DTYPES, parse_dates=ORDERS_DATE_COLUMNS)
+    payments = pd.read_csv('../data/sample_payments.csv', dtype=PAYMENTS_DTYPES)
+    customers = pd.read_csv('../data/sample_customers.csv', dtype=CUSTOMERS_DTYPES)
     
     print(f"✅ Loaded {len(orders)} orders, {len(payments)} payments, {len(customers)} customers")
     return orders, payments, customers
@@ -33,6 +35,8 @@ def run_comprehensive_analysis():
     
     # Load data
     orders, payments, customers = load_data()
+    # Order-level payments joined once and shared by the script-level breakdowns below
+    orders_payments = orders.merge(payments, on='order_id')
     
     # === PHASE 1: BASIC ANALYSIS ===
     print("\n" + "=" * 80)
@@ -41,13 +45,15 @@ def run_comprehensive_analysis():
     
     # RFM Analysis
     print("\n🎯 Running RFM Analysis...")
-    last_order_date = pd.to_datetime(orders['order_purchase_timestamp']).max()
+    last_order_date = orders['order_purchase_timestamp'].max()
     reference_date = last_order_date + pd.Timedelta(days=1)
     
     rfm = RFMAnalyzer(reference_date)
     rfm_df = rfm.calculate_rfm(orders, payments)
     rfm_scores = rfm.assign_scores(rfm_df)
     rfm_segments = rfm.create_segments(rfm_scores)
+    # Six labels reused in every later breakdown: categorical codes make each mask an int compare
+    rfm_segments['segment'] = rfm_segments['segment'].astype('category')
     
     print("Basic RFM Summary:")
     print(rfm.get_segment_summary(rfm_segments))
@@ -105,13 +111,13 @@ def run_comprehensive_analysis():
     print("=" * 80)
     
     # Customer lifecycle insights
-    analyze_customer_lifecycle(orders, payments, rfm_segments)
+    analyze_customer_lifecycle(orders_payments, rfm_segments)
     
     # Revenue trend analysis
-    analyze_revenue_trends(orders, payments)
+    analyze_revenue_trends(orders_payments)
     
     # Geographic insights (if available)
-    analyze_geographic_patterns(customers, orders, payments)
+    analyze_geographic_patterns(customers, orders_payments)
     
     # === SAVE ENHANCED RESULTS ===
     print("\n💾 Saving enhanced analysis results...")
@@ -119,72 +125,86 @@ def run_comprehensive_analysis():
     # Save all results with timestamps
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     
-    rfm_segments.to_csv(f'../outputs/rfm_segments_detailed_{timestamp}.csv', index=False)
-    retention.to_csv(f'../outputs/retention_matrix_{timestamp}.csv')
-    ltv_segments.to_csv(f'../outputs/customer_ltv_detailed_{timestamp}.csv')
-    customer_journey.to_csv(f'../outputs/customer_journey_{timestamp}.csv')
+    save_tasks = [
+        (rfm_segments, f'../outputs/rfm_segments_detailed_{timestamp}.csv', False),
+        (retention, f'../outputs/retention_matrix_{timestamp}.csv', True),
+        (ltv_segments, f'../outputs/customer_ltv_detailed_{timestamp}.csv', True),
+        (customer_journey, f'../outputs/customer_journey_{timestamp}.csv', True)
+    ]
     
-    # Generate summary report
-    generate_executive_summary(rfm_segments, retention, ltv_segments, customer_journey)
+    # The CSV writes overlap each other and the summary report; .result() re-raises any write error
+    with ThreadPoolExecutor(max_workers=len(save_tasks)) as executor:
+        futures = [executor.submit(frame.to_csv, path, index=index) for frame, path, index in save_tasks]
+        
+        # Generate summary report
+        generate_executive_summary(rfm_segments, retention, ltv_segments, customer_journey)
+        
+        for future in futures:
+            future.result()
     
     print(f"✅ Advanced analysis complete! Results saved with timestamp {timestamp}")
     print("📊 Check outputs/ folder for detailed CSV files")
     print("📄 Executive summary saved as executive_summary.txt")
 
-def analyze_customer_lifecycle(orders, payments, rfm_segments):
-    """Analyze customer lifecycle patterns"""
+def analyze_customer_lifecycle(df, rfm_segments):
+    """Analyze customer lifecycle patterns from the merged orders/payments frame"""
     print("\n🔄 CUSTOMER LIFECYCLE ANALYSIS:")
     print("-" * 60)
     
-    # Merge data
-    df = orders.merge(payments, on='order_id')
-    df['order_date'] = pd.to_datetime(df['order_purchase_timestamp'])
-    
     # Calculate days between orders for each customer
-    df_sorted = df.sort_values(['customer_id', 'order_date'])
-    df_sorted['days_between_orders'] = df_sorted.groupby('customer_id')['order_date'].diff().dt.days
+    df_sorted = df.sort_values(['customer_id', 'order_purchase_timestamp'])
+    days_between_orders = df_sorted.groupby('customer_id')['order_purchase_timestamp'].diff().dt.days
     
     # Average time between orders
-    avg_days_between = df_sorted['days_between_orders'].mean()
-    median_days_between = df_sorted['days_between_orders'].median()
+    avg_days_between = days_between_orders.mean()
+    median_days_between = days_between_orders.median()
+    del df_sorted, days_between_orders
     
     print(f"   Average days between orders: {avg_days_between:.1f}")
     print(f"   Median days between orders: {median_days_between:.1f}")
     
+    # One per-customer aggregation feeds both the frequency and the top-value breakdowns
+    customer_stats = df.groupby('customer_id').agg(
+        total_value=('payment_value', 'sum'),
+        n_orders=('order_id', 'count')
+    )
+    
     # Purchase frequency patterns
-    order_frequency = df.groupby('customer_id').size()
+    order_frequency = customer_stats['n_orders']
+    
+    freq_counts = order_frequency.value_counts()
     
     print(f"\n   Purchase Frequency Distribution:")
     for freq in [1, 2, 3, 4, 5]:
-        count = (order_frequency == freq).sum()
+        count = int(freq_counts.get(freq, 0))
         pct = count / len(order_frequency) * 100
         print(f"     {freq} orders: {count} customers ({pct:.1f}%)")
     
     # High-value customer journey
-    high_value_customers = df.groupby('customer_id')['payment_value'].sum().nlargest(10)
+    high_value_customers = customer_stats.nlargest(10, 'total_value')
     print(f"\n   Top 10 Customer Values:")
-    for customer_id, value in high_value_customers.items():
-        orders_count = len(df[df['customer_id'] == customer_id])
-        print(f"     Customer {customer_id}: ${value:.2f} ({orders_count} orders)")
+    for customer in high_value_customers.itertuples():
+        print(f"     Customer {customer.Index}: ${customer.total_value:.2f} ({customer.n_orders} orders)")
 
-def analyze_revenue_trends(orders, payments):
-    """Analyze revenue trends over time"""
+def analyze_revenue_trends(df):
+    """Analyze revenue trends over time from the merged orders/payments frame"""
     print("\n📈 REVENUE TREND ANALYSIS:")
     print("-" * 60)
     
-    # Merge and prepare data
-    df = orders.merge(payments, on='order_id')
-    df['order_date'] = pd.to_datetime(df['order_purchase_timestamp'])
-    df['month'] = df['order_date'].dt.to_period('M')
+    # Prepare data - truncating to month in NumPy skips building a PeriodIndex over every
+    # row, and grouping by a key array leaves the shared frame untouched
+    month = df['order_purchase_timestamp'].to_numpy().astype('datetime64[M]')
     
     # Monthly revenue trends
-    monthly_revenue = df.groupby('month').agg({
+    monthly_revenue = df.groupby(month).agg({
         'payment_value': 'sum',
         'order_id': 'count',
         'customer_id': 'nunique'
     }).round(2)
     
     monthly_revenue.columns = ['revenue', 'orders', 'customers']
+    # Label the handful of result rows as months again
+    monthly_revenue.index = monthly_revenue.index.to_period('M').rename('month')
     monthly_revenue['avg_order_value'] = monthly_revenue['revenue'] / monthly_revenue['orders']
     monthly_revenue['revenue_per_customer'] = monthly_revenue['revenue'] / monthly_revenue['customers']
     
@@ -198,7 +218,7 @@ def analyze_revenue_trends(orders, payments):
     print(f"\n   Average monthly revenue growth: {monthly_revenue['revenue_growth'].mean():.1f}%")
     print(f"   Average monthly customer growth: {monthly_revenue['customer_growth'].mean():.1f}%")
 
-def analyze_geographic_patterns(customers, orders, payments):
+def analyze_geographic_patterns(customers, orders_payments):
     """Analyze geographic distribution patterns"""
     print("\n🗺️  GEOGRAPHIC ANALYSIS:")
     print("-" * 60)
@@ -213,8 +233,8 @@ def analyze_geographic_patterns(customers, orders, payments):
             print(f"     {state}: {count} customers ({pct:.1f}%)")
         
         # Revenue by state
-        customer_orders = orders.merge(customers, on='customer_id')
-        revenue_by_state = customer_orders.merge(payments, on='order_id').groupby('customer_state')['payment_value'].sum().sort_values(ascending=False).head(10)
+        customer_orders = orders_payments.merge(customers, on='customer_id')
+        revenue_by_state = customer_orders.groupby('customer_state')['payment_value'].sum().sort_values(ascending=False).head(10)
         
         print(f"\n   Top 10 States by Revenue:")
         for state, revenue in revenue_by_state.items():
@@ -224,6 +244,15 @@ def analyze_geographic_patterns(customers, orders, payments):
 
 def generate_executive_summary(rfm_segments, retention, ltv_segments, customer_journey):
     """Generate executive summary report"""
+    # Segment sizes and revenue in one grouped pass, instead of a boolean mask per figure
+    n_customers = len(rfm_segments)
+    seg_stats = rfm_segments.groupby('segment', observed=True)['monetary'].agg(['count', 'sum'])
+    seg_counts, seg_monetary = seg_stats['count'], seg_stats['sum']
+    total_monetary = rfm_segments['monetary'].sum()
+    champions = seg_counts.get('Champions', 0)
+    at_risk = seg_counts.get('At Risk', 0)
+    lost = seg_counts.get('Lost', 0)
+    at_risk_value = seg_monetary.get('At Risk', 0.0)
     
     summary_text = f"""
 EXECUTIVE SUMMARY - OLIST E-COMMERCE ANALYTICS
@@ -232,16 +261,16 @@ Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
 
 KEY PERFORMANCE METRICS
 -----------------------
-• Total Customers Analyzed: {len(rfm_segments):,}
+• Total Customers Analyzed: {n_customers:,}
 • Average Customer LTV: ${ltv_segments['total_revenue'].mean():.2f}
 • Average Orders per Customer: {customer_journey['total_orders'].mean():.2f}
 • Average Order Value: ${customer_journey['avg_order_value'].mean():.2f}
 
 CUSTOMER SEGMENTATION INSIGHTS
 ------------------------------
-• Champions (High Value): {len(rfm_segments[rfm_segments['segment'] == 'Champions'])} customers ({len(rfm_segments[rfm_segments['segment'] == 'Champions'])/len(rfm_segments)*100:.1f}%)
-• At Risk Customers: {len(rfm_segments[rfm_segments['segment'] == 'At Risk'])} customers ({len(rfm_segments[rfm_segments['segment'] == 'At Risk'])/len(rfm_segments)*100:.1f}%)
-• Lost Customers: {len(rfm_segments[rfm_segments['segment'] == 'Lost'])} customers ({len(rfm_segments[rfm_segments['segment'] == 'Lost'])/len(rfm_segments)*100:.1f}%)
+• Champions (High Value): {champions} customers ({champions/n_customers*100:.1f}%)
+• At Risk Customers: {at_risk} customers ({at_risk/n_customers*100:.1f}%)
+• Lost Customers: {lost} customers ({lost/n_customers*100:.1f}%)
 
 RETENTION PERFORMANCE
 --------------------
@@ -251,9 +280,9 @@ RETENTION PERFORMANCE
 
 REVENUE OPPORTUNITIES
 --------------------
-• Champions Revenue Share: {rfm_segments[rfm_segments['segment'] == 'Champions']['monetary'].sum()/rfm_segments['monetary'].sum()*100:.1f}%
-• At Risk Customer Value: ${rfm_segments[rfm_segments['segment'] == 'At Risk']['monetary'].sum():.2f}
-• Win-back Opportunity (25% success): ${rfm_segments[rfm_segments['segment'] == 'At Risk']['monetary'].sum() * 0.25:.2f}
+• Champions Revenue Share: {seg_monetary.get('Champions', 0.0)/total_monetary*100:.1f}%
+• At Risk Customer Value: ${at_risk_value:.2f}
+• Win-back Opportunity (25% success): ${at_risk_value * 0.25:.2f}
 
 STRATEGIC RECOMMENDATIONS
 ------------------------
@@ -7,10 +7,29 @@ Test the dashboard in non-blocking mode
 
 import sys
 import os
+import socket
 import subprocess
+import tempfile
 import webbrowser
 import time
 
+DASHBOARD_HOST = "localhost"
+DASHBOARD_PORT = 8050
+STARTUP_TIMEOUT = 30  # seconds
+
+def wait_for_server(process, host=DASHBOARD_HOST, port=DASHBOARD_PORT, timeout=STARTUP_TIMEOUT):
+    """Poll until the server accepts connections, backing off between attempts"""
+    deadline = time.monotonic() + timeout
+    delay = 0.05
+    while time.monotonic() < deadline and process.poll() is None:
+        try:
+            with socket.create_connection((host, port), timeout=0.2):
+                return True
+        except OSError:
+            time.sleep(delay)
+            delay = min(delay * 2, 1.0)
+    return False
+
 def test_dashboard():
     """Test dashboard with automatic browser opening"""
     
@@ -29,21 +48,21 @@ def test_dashboard():
     try:
         print("🔧 Starting dashboard server...")
         
-        # Start dashboard process
-        process = subprocess.Popen([
-            sys.executable, "launch_dashboard.py"
-        ], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        # Start dashboard process - output goes to a log file, since nothing would drain a pipe
+        log_path = os.path.join(tempfile.gettempdir(), "olist_dashboard_test.log")
+        with open(log_path, "wb") as log_file:
+            process = subprocess.Popen([
+                sys.executable, "launch_dashboard.py"
+            ], stdout=log_file, stderr=subprocess.STDOUT)
         
-        # Wait a moment for server to start
-        time.sleep(3)
-        
-        # Check if process is running
-        if process.poll() is None:
+        # Wait for the server to accept connections
+        if wait_for_server(process):
             print("✅ Dashboard server started successfully!")
-            print("🌐 Opening browser to http://localhost:8050")
+            print(f"🌐 Opening browser to http://{DASHBOARD_HOST}:{DASHBOARD_PORT}")
+            print(f"📝 Server log: {log_path}")
             
             # Open browser
-            webbrowser.open("http://localhost:8050")
+            webbrowser.open(f"http://{DASHBOARD_HOST}:{DASHBOARD_PORT}")
             
             print("\n📊 Dashboard Features to Test:")
             print("- Overview tab with KPI cards and charts")
@@ -66,8 +85,11 @@ def test_dashboard():
             return True
         else:
             print("❌ Dashboard failed to start")
-            stdout, stderr = process.communicate()
-            print(f"Error: {stderr.decode()}")
+            if process.poll() is None:
+                process.terminate()
+            process.wait()
+            with open(log_path, "rb") as log_file:
+                print(f"Error: {log_file.read().decode(errors='replace')}")
             return False
             
     except Exception as e:
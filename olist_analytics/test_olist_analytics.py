@@ -9,8 +9,13 @@ import pandas as pd
 import numpy as np
 import sys
 import os
+import io
+import contextlib
 import tempfile
+import warnings
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
 
 # Add src directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
@@ -19,6 +24,25 @@ from src.analytics.rfm_analysis import RFMAnalyzer
 from src.analytics.cohort_analysis import CohortAnalyzer
 from src.analytics.ltv_modeling import LTVPredictor
 from src.analytics.advanced_analysis import AdvancedAnalyzer
+from src.data_quality.validator import DataValidator, PatternRule, RangeRule, ValidationResult
+# Fixture dtypes match what the analysis scripts' loaders produce
+from src.analytics.dtypes import ORDERS_DTYPES, PAYMENTS_DTYPES, CUSTOMERS_DTYPES
+
+# pytest-xdist is optional - spreads the test classes across CPU cores when present
+try:
+    import xdist  # noqa: F401
+    XDIST_AVAILABLE = True
+except ImportError:
+    XDIST_AVAILABLE = False
+
+# Sample IDs are formatted once and sliced/indexed by every fixture build
+MAX_SAMPLE_CUSTOMERS = 1000
+MAX_SAMPLE_ORDERS = 10000
+_CUSTOMER_IDS = np.array([f"customer_{i:03d}" for i in range(MAX_SAMPLE_CUSTOMERS)], dtype=object)
+_ORDER_IDS = np.array([f"order_{i:04d}" for i in range(MAX_SAMPLE_ORDERS)], dtype=object)
+
+# Days sample orders are drawn from
+_DATE_RANGE = pd.date_range(datetime(2017, 1, 1), datetime(2017, 12, 31), freq='D')
 
 
 class TestDataGeneration:
@@ -27,84 +51,129 @@ class TestDataGeneration:
     @staticmethod
     def create_sample_orders(n_customers=20, n_orders=100):
         """Create sample orders data for testing"""
-        np.random.seed(42)
-        
-        # Create date range
-        start_date = datetime(2017, 1, 1)
-        end_date = datetime(2017, 12, 31)
-        date_range = pd.date_range(start_date, end_date, freq='D')
-        
-        orders = []
-        for i in range(n_orders):
-            customer_id = f"customer_{np.random.randint(0, n_customers):03d}"
-            order_id = f"order_{i:04d}"
-            order_date = np.random.choice(date_range)
-            
-            # Convert numpy datetime to python datetime for string formatting
-            order_date_py = pd.to_datetime(order_date).to_pydatetime()
-            
-            orders.append({
-                'order_id': order_id,
-                'customer_id': customer_id,
-                'order_status': 'delivered',
-                'order_purchase_timestamp': order_date_py.strftime('%Y-%m-%d'),
-                'order_delivered_carrier_date': (order_date_py + timedelta(days=2)).strftime('%Y-%m-%d'),
-                'order_delivered_customer_date': (order_date_py + timedelta(days=5)).strftime('%Y-%m-%d'),
-                'freight_value': np.random.uniform(10, 50)
-            })
-        
-        return pd.DataFrame(orders)
+        # Deterministic for given sizes, so build once and hand out copies
+        return TestDataGeneration._build_sample_orders(n_customers, n_orders).copy()
+    
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _build_sample_orders(n_customers, n_orders):
+        rng = np.random.default_rng(42)
+        
+        # Draw every order's customer and date at once; dates are formatted column-wise
+        customer_numbers = rng.integers(0, n_customers, n_orders)
+        order_dates = _DATE_RANGE[rng.integers(0, len(_DATE_RANGE), n_orders)]
+        
+        return pd.DataFrame({
+            'order_id': _ORDER_IDS[:n_orders],
+            'customer_id': _CUSTOMER_IDS[customer_numbers],
+            'order_status': 'delivered',
+            'order_purchase_timestamp': order_dates.strftime('%Y-%m-%d'),
+            'order_delivered_carrier_date': (order_dates + timedelta(days=2)).strftime('%Y-%m-%d'),
+            'order_delivered_customer_date': (order_dates + timedelta(days=5)).strftime('%Y-%m-%d'),
+            'freight_value': rng.uniform(10, 50, n_orders)
+        }).astype(ORDERS_DTYPES)
     
     @staticmethod
     def create_sample_payments(orders_df):
         """Create sample payments data matching orders"""
-        np.random.seed(42)
-        
-        payments = []
-        for _, order in orders_df.iterrows():
-            payments.append({
-                'order_id': order['order_id'],
-                'payment_sequential': 1,
-                'payment_type': np.random.choice(['credit_card', 'boleto', 'debit_card'], p=[0.7, 0.2, 0.1]),
-                'payment_installments': np.random.choice([1, 2, 3, 6], p=[0.5, 0.2, 0.2, 0.1]),
-                'payment_value': np.random.uniform(50, 500)
-            })
-        
-        return pd.DataFrame(payments)
+        rng = np.random.default_rng(42)
+        n_payments = len(orders_df)
+        
+        # One payment per order, every column drawn in a single call
+        return pd.DataFrame({
+            'order_id': orders_df['order_id'].to_numpy(),
+            'payment_sequential': 1,
+            'payment_type': rng.choice(['credit_card', 'boleto', 'debit_card'], size=n_payments, p=[0.7, 0.2, 0.1]),
+            'payment_installments': rng.choice([1, 2, 3, 6], size=n_payments, p=[0.5, 0.2, 0.2, 0.1]),
+            'payment_value': rng.uniform(50, 500, n_payments)
+        }).astype(PAYMENTS_DTYPES)
     
     @staticmethod
     def create_sample_customers(n_customers=20):
         """Create sample customers data"""
-        np.random.seed(42)
+        return TestDataGeneration._build_sample_customers(n_customers).copy()
+    
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _build_sample_customers(n_customers):
+        rng = np.random.default_rng(42)
         
-        customers = []
         states = ['SP', 'RJ', 'MG', 'RS', 'PR', 'BA', 'DF', 'SC']
+        customer_ids = _CUSTOMER_IDS[:n_customers]
+        
+        return pd.DataFrame({
+            'customer_id': customer_ids,
+            'customer_unique_id': customer_ids,
+            'customer_zip_code_prefix': rng.integers(10000, 99999, n_customers),
+            'customer_city': [f"city_{i}" for i in range(n_customers)],
+            'customer_state': rng.choice(states, size=n_customers)
+        }).astype(CUSTOMERS_DTYPES)
+
+
+class _NullIO:
+    """stdout sink that drops writes - the print-heavy analyzers' output is never inspected"""
+    
+    def write(self, text):
+        return len(text)
+    
+    def flush(self):
+        pass
+
+
+class _shared_fixture:
+    """Class attribute built by the decorated function on first access, then reused by every TestCase"""
+    
+    def __init__(self, build):
+        self.build = build
         
-        for i in range(n_customers):
-            customer_id = f"customer_{i:03d}"
-            customers.append({
-                'customer_id': customer_id,
-                'customer_unique_id': customer_id,
-                'customer_zip_code_prefix': np.random.randint(10000, 99999),
-                'customer_city': f"city_{i}",
-                'customer_state': np.random.choice(states)
-            })
-        
-        return pd.DataFrame(customers)
+    def __get__(self, instance, owner):
+        if not hasattr(self, 'value'):
+            self.value = self.build(owner)
+        return self.value
 
 
-class TestRFMAnalysis(unittest.TestCase):
+class _SharedFixtures:
+    """Sample data and pipeline outputs shared by the TestCases; analyzers only read their inputs"""
+    
+    @_shared_fixture
+    def orders(cls):
+        return TestDataGeneration.create_sample_orders()
+    
+    @_shared_fixture
+    def payments(cls):
+        return TestDataGeneration.create_sample_payments(cls.orders)
+    
+    @_shared_fixture
+    def rfm_df(cls):
+        return RFMAnalyzer().calculate_rfm(cls.orders, cls.payments)
+    
+    @_shared_fixture
+    def rfm_scores(cls):
+        return RFMAnalyzer().assign_scores(cls.rfm_df)
+    
+    @_shared_fixture
+    def rfm_segments(cls):
+        return RFMAnalyzer().create_segments(cls.rfm_scores)
+    
+    @_shared_fixture
+    def cohort_df(cls):
+        return CohortAnalyzer().create_cohorts(cls.orders, cls.payments)
+    
+    @_shared_fixture
+    def ltv_df(cls):
+        return LTVPredictor().calculate_historical_ltv(cls.orders, cls.payments)
+
+
+class TestRFMAnalysis(_SharedFixtures, unittest.TestCase):
     """Test RFM Analysis functionality"""
     
     def setUp(self):
-        """Set up test data"""
-        self.orders = TestDataGeneration.create_sample_orders()
-        self.payments = TestDataGeneration.create_sample_payments(self.orders)
+        """Set up a fresh analyzer"""
         self.rfm_analyzer = RFMAnalyzer()
     
     def test_rfm_calculation(self):
         """Test RFM metrics calculation"""
-        rfm_df = self.rfm_analyzer.calculate_rfm(self.orders, self.payments)
+        rfm_df = self.rfm_df
         
         # Check that we have the right columns
         expected_columns = ['customer_id', 'recency', 'frequency', 'monetary']
@@ -125,8 +194,7 @@ class TestRFMAnalysis(unittest.TestCase):
     
     def test_rfm_scoring(self):
         """Test RFM scoring functionality"""
-        rfm_df = self.rfm_analyzer.calculate_rfm(self.orders, self.payments)
-        rfm_scores = self.rfm_analyzer.assign_scores(rfm_df)
+        rfm_scores = self.rfm_scores
         
         # Check score columns exist
         score_columns = ['r_score', 'f_score', 'm_score', 'rfm_score']
@@ -137,17 +205,17 @@ class TestRFMAnalysis(unittest.TestCase):
         for score_col in ['r_score', 'f_score', 'm_score']:
             valid_scores = rfm_scores[score_col].dropna()
             if len(valid_scores) > 0:
-                self.assertTrue((valid_scores >= 1).all())
-                self.assertTrue((valid_scores <= 5).all())
+                self.assertTrue(((valid_scores >= 1) & (valid_scores <= 5)).all())
         
-        # Check RFM score format (3 digits)
-        self.assertTrue(rfm_scores['rfm_score'].str.len().eq(3).all())
+        # Check RFM score format (3 digits) on a fixed-width string array
+        score_text = rfm_scores['rfm_score'].to_numpy().astype(str)
+        self.assertTrue((np.char.str_len(score_text) == 3).all())
+        # A null would stringify to 'nan'/'None', so the characters must be digits too
+        self.assertTrue(np.char.isdigit(score_text).all())
     
     def test_customer_segmentation(self):
         """Test customer segmentation logic"""
-        rfm_df = self.rfm_analyzer.calculate_rfm(self.orders, self.payments)
-        rfm_scores = self.rfm_analyzer.assign_scores(rfm_df)
-        rfm_segments = self.rfm_analyzer.create_segments(rfm_scores)
+        rfm_segments = self.rfm_segments
         
         # Check segment column exists
         self.assertIn('segment', rfm_segments.columns)
@@ -163,10 +231,7 @@ class TestRFMAnalysis(unittest.TestCase):
     
     def test_segment_summary(self):
         """Test segment summary generation"""
-        rfm_df = self.rfm_analyzer.calculate_rfm(self.orders, self.payments)
-        rfm_scores = self.rfm_analyzer.assign_scores(rfm_df)
-        rfm_segments = self.rfm_analyzer.create_segments(rfm_scores)
-        summary = self.rfm_analyzer.get_segment_summary(rfm_segments)
+        summary = self.rfm_analyzer.get_segment_summary(self.rfm_segments)
         
         # Check summary columns
         expected_columns = ['customer_count', 'avg_revenue', 'total_revenue', 'pct_customers', 'pct_revenue']
@@ -176,20 +241,27 @@ class TestRFMAnalysis(unittest.TestCase):
         # Check percentage sums to ~100%
         self.assertAlmostEqual(summary['pct_customers'].sum(), 100.0, places=0)
         self.assertAlmostEqual(summary['pct_revenue'].sum(), 100.0, places=0)
+    
+    def test_segment_summary_categorical(self):
+        """Test that unused segment categories are left out of the summary"""
+        rfm_segments = self.rfm_segments.copy()
+        rfm_segments['segment'] = rfm_segments['segment'].astype('category').cat.add_categories(['Unused'])
+        summary = self.rfm_analyzer.get_segment_summary(rfm_segments)
+        
+        self.assertNotIn('Unused', summary.index)
+        self.assertEqual(len(summary), rfm_segments['segment'].nunique())
 
 
-class TestCohortAnalysis(unittest.TestCase):
+class TestCohortAnalysis(_SharedFixtures, unittest.TestCase):
     """Test Cohort Analysis functionality"""
     
     def setUp(self):
-        """Set up test data"""
-        self.orders = TestDataGeneration.create_sample_orders()
-        self.payments = TestDataGeneration.create_sample_payments(self.orders)
+        """Set up a fresh analyzer"""
         self.cohort_analyzer = CohortAnalyzer()
     
     def test_cohort_creation(self):
         """Test cohort data creation"""
-        cohort_df = self.cohort_analyzer.create_cohorts(self.orders, self.payments)
+        cohort_df = self.cohort_df
         
         # Check required columns exist
         required_columns = ['customer_id', 'order_id', 'payment_value', 'order_date', 'cohort_month', 'order_month', 'cohort_index']
@@ -200,13 +272,12 @@ class TestCohortAnalysis(unittest.TestCase):
         self.assertTrue((cohort_df['cohort_index'] >= 0).all())
         
         # Check that first purchases have cohort_index = 0
-        first_purchases = cohort_df.groupby('customer_id')['order_date'].min().reset_index()
-        first_purchase_rows = cohort_df.merge(first_purchases, on=['customer_id', 'order_date'])
-        self.assertTrue((first_purchase_rows['cohort_index'] == 0).all())
+        is_first_purchase = cohort_df['order_date'] == cohort_df.groupby('customer_id')['order_date'].transform('min')
+        self.assertTrue((cohort_df.loc[is_first_purchase, 'cohort_index'] == 0).all())
     
     def test_retention_calculation(self):
         """Test retention rate calculation"""
-        cohort_df = self.cohort_analyzer.create_cohorts(self.orders, self.payments)
+        cohort_df = self.cohort_df
         retention = self.cohort_analyzer.calculate_retention(cohort_df)
         
         # Check retention matrix structure
@@ -220,15 +291,14 @@ class TestCohortAnalysis(unittest.TestCase):
             # Allow for small floating point differences
             self.assertTrue(np.allclose(first_column_values, 100.0, rtol=0.01))
         
-        # Check retention values are between 0 and 100
-        retention_values = retention.values.flatten()
+        # Check retention values are between 0 and 100 ('K' order flattens the block without a copy)
+        retention_values = retention.to_numpy(copy=False).ravel('K')
         retention_values = retention_values[~np.isnan(retention_values)]
-        self.assertTrue((retention_values >= 0).all())
-        self.assertTrue((retention_values <= 100).all())
+        self.assertTrue(((retention_values >= 0) & (retention_values <= 100)).all())
     
     def test_revenue_cohorts(self):
         """Test revenue cohort calculation"""
-        cohort_df = self.cohort_analyzer.create_cohorts(self.orders, self.payments)
+        cohort_df = self.cohort_df
         revenue_cohorts = self.cohort_analyzer.calculate_revenue_cohorts(cohort_df)
         
         # Check structure
@@ -236,13 +306,13 @@ class TestCohortAnalysis(unittest.TestCase):
         self.assertTrue(len(revenue_cohorts) > 0)
         
         # Check all values are non-negative
-        revenue_values = revenue_cohorts.values.flatten()
+        revenue_values = revenue_cohorts.to_numpy(copy=False).ravel('K')
         revenue_values = revenue_values[~np.isnan(revenue_values)]
         self.assertTrue((revenue_values >= 0).all())
     
     def test_cohort_metrics(self):
         """Test cohort metrics summary"""
-        cohort_df = self.cohort_analyzer.create_cohorts(self.orders, self.payments)
+        cohort_df = self.cohort_df
         metrics = self.cohort_analyzer.get_cohort_metrics(cohort_df)
         
         # Check required columns
@@ -255,18 +325,16 @@ class TestCohortAnalysis(unittest.TestCase):
         self.assertTrue((metrics['orders_per_customer'] >= 1).all())
 
 
-class TestLTVModeling(unittest.TestCase):
+class TestLTVModeling(_SharedFixtures, unittest.TestCase):
     """Test LTV Modeling functionality"""
     
     def setUp(self):
-        """Set up test data"""
-        self.orders = TestDataGeneration.create_sample_orders()
-        self.payments = TestDataGeneration.create_sample_payments(self.orders)
+        """Set up a fresh analyzer"""
         self.ltv_predictor = LTVPredictor()
     
     def test_historical_ltv_calculation(self):
         """Test historical LTV calculation"""
-        ltv_df = self.ltv_predictor.calculate_historical_ltv(self.orders, self.payments)
+        ltv_df = self.ltv_df
         
         # Check required columns
         expected_columns = ['total_revenue', 'order_count', 'first_order', 'last_order', 'avg_order_value', 'lifespan_days']
@@ -281,7 +349,8 @@ class TestLTVModeling(unittest.TestCase):
         
         # Check calculated avg_order_value (allow for small rounding differences due to pandas rounding)
         calculated_aov = ltv_df['total_revenue'] / ltv_df['order_count']
-        np.testing.assert_allclose(calculated_aov.values, ltv_df['avg_order_value'].values, rtol=1e-4)
+        pd.testing.assert_series_equal(calculated_aov, ltv_df['avg_order_value'], check_exact=False,
+                                       rtol=1e-4, atol=0, check_names=False, check_dtype=False)
     
     def test_simple_ltv_prediction(self):
         """Test simple LTV prediction formula"""
@@ -301,7 +370,7 @@ class TestLTVModeling(unittest.TestCase):
     
     def test_ltv_segmentation(self):
         """Test LTV customer segmentation"""
-        ltv_df = self.ltv_predictor.calculate_historical_ltv(self.orders, self.payments)
+        ltv_df = self.ltv_df
         ltv_segments = self.ltv_predictor.segment_ltv(ltv_df)
         
         # Check segment column exists
@@ -319,7 +388,7 @@ class TestLTVModeling(unittest.TestCase):
     
     def test_cac_payback_calculation(self):
         """Test CAC payback calculation"""
-        ltv_df = self.ltv_predictor.calculate_historical_ltv(self.orders, self.payments)
+        ltv_df = self.ltv_df
         cac = 50
         cac_analysis = self.ltv_predictor.calculate_cac_payback(ltv_df, cac)
         
@@ -338,32 +407,19 @@ class TestLTVModeling(unittest.TestCase):
         self.assertAlmostEqual(cac_analysis['ltv_cac_ratio'], expected_ratio, places=2)
 
 
-class TestAdvancedAnalysis(unittest.TestCase):
+class TestAdvancedAnalysis(_SharedFixtures, unittest.TestCase):
     """Test Advanced Analysis functionality"""
     
     def setUp(self):
-        """Set up test data and analysis results"""
-        self.orders = TestDataGeneration.create_sample_orders()
-        self.payments = TestDataGeneration.create_sample_payments(self.orders)
-        
-        # Create RFM analysis results for advanced analysis
-        rfm_analyzer = RFMAnalyzer()
-        rfm_df = rfm_analyzer.calculate_rfm(self.orders, self.payments)
-        rfm_scores = rfm_analyzer.assign_scores(rfm_df)
-        self.rfm_segments = rfm_analyzer.create_segments(rfm_scores)
-        
+        """Set up a fresh analyzer"""
         self.advanced_analyzer = AdvancedAnalyzer()
     
     def test_detailed_rfm_breakdown(self):
         """Test detailed RFM breakdown analysis"""
         # This method prints results, so we mainly test it doesn't crash
         try:
-            # Capture output to avoid cluttering test results
-            import io
-            import contextlib
-            
-            f = io.StringIO()
-            with contextlib.redirect_stdout(f):
+            # Discard output to avoid cluttering test results
+            with contextlib.redirect_stdout(_NullIO()):
                 result = self.advanced_analyzer.detailed_rfm_breakdown(self.rfm_segments)
             
             # Check that some analysis was performed
@@ -375,12 +431,8 @@ class TestAdvancedAnalysis(unittest.TestCase):
     def test_payment_method_analysis(self):
         """Test payment method analysis"""
         try:
-            # Capture output to avoid cluttering test results
-            import io
-            import contextlib
-            
-            f = io.StringIO()
-            with contextlib.redirect_stdout(f):
+            # Discard output to avoid cluttering test results
+            with contextlib.redirect_stdout(_NullIO()):
                 self.advanced_analyzer.payment_method_analysis(self.payments)
             
             # If we get here without exception, the test passes
@@ -391,17 +443,10 @@ class TestAdvancedAnalysis(unittest.TestCase):
     
     def test_ltv_deep_analysis(self):
         """Test LTV deep analysis"""
-        ltv_predictor = LTVPredictor()
-        ltv_df = ltv_predictor.calculate_historical_ltv(self.orders, self.payments)
-        
         try:
-            # Capture output to avoid cluttering test results
-            import io
-            import contextlib
-            
-            f = io.StringIO()
-            with contextlib.redirect_stdout(f):
-                result = self.advanced_analyzer.ltv_deep_analysis(ltv_df, self.orders, self.payments)
+            # Discard output to avoid cluttering test results
+            with contextlib.redirect_stdout(_NullIO()):
+                result = self.advanced_analyzer.ltv_deep_analysis(self.ltv_df, self.orders, self.payments)
             
             # Check that customer journey analysis was performed
             self.assertIsNotNone(result)
@@ -411,27 +456,16 @@ class TestAdvancedAnalysis(unittest.TestCase):
             self.fail(f"ltv_deep_analysis raised an exception: {e}")
 
 
-class TestEndToEndWorkflow(unittest.TestCase):
+class TestEndToEndWorkflow(_SharedFixtures, unittest.TestCase):
     """Test end-to-end workflow functionality"""
     
     def setUp(self):
-        """Set up test data and temporary directory"""
+        """Set up temporary directory"""
+        # The pipeline tests work on the in-memory frames; nothing is read back from disk
         self.test_dir = tempfile.mkdtemp()
-        self.data_dir = os.path.join(self.test_dir, 'data')
         self.outputs_dir = os.path.join(self.test_dir, 'outputs')
         
-        os.makedirs(self.data_dir)
         os.makedirs(self.outputs_dir)
-        
-        # Create test data files
-        self.orders = TestDataGeneration.create_sample_orders()
-        self.payments = TestDataGeneration.create_sample_payments(self.orders)
-        self.customers = TestDataGeneration.create_sample_customers()
-        
-        # Save test data
-        self.orders.to_csv(os.path.join(self.data_dir, 'sample_orders.csv'), index=False)
-        self.payments.to_csv(os.path.join(self.data_dir, 'sample_payments.csv'), index=False)
-        self.customers.to_csv(os.path.join(self.data_dir, 'sample_customers.csv'), index=False)
     
     def test_complete_analysis_pipeline(self):
         """Test the complete analysis pipeline"""
@@ -456,12 +490,8 @@ class TestEndToEndWorkflow(unittest.TestCase):
         self.assertTrue(len(retention) > 0)
         self.assertTrue(len(ltv_segments) > 0)
         
-        # Check data consistency
-        customer_ids_rfm = set(rfm_segments['customer_id'])
-        customer_ids_ltv = set(ltv_segments.index)
-        
-        # All customers in LTV should be in RFM
-        self.assertTrue(customer_ids_ltv.issubset(customer_ids_rfm))
+        # Check data consistency: all customers in LTV should be in RFM
+        self.assertTrue(ltv_segments.index.isin(rfm_segments['customer_id'].to_numpy()).all())
     
     def test_data_quality_checks(self):
         """Test data quality and edge cases"""
@@ -480,8 +510,11 @@ class TestEndToEndWorkflow(unittest.TestCase):
             pass
         
         # Test with single customer
-        single_customer_orders = self.orders[self.orders['customer_id'] == self.orders['customer_id'].iloc[0]].copy()
-        single_customer_payments = self.payments[self.payments['order_id'].isin(single_customer_orders['order_id'])].copy()
+        # Slices of the shared fixtures are read-only here, so no copies are needed
+        customer_id = self.orders['customer_id'].iat[0]
+        single_customer_orders = self.orders[self.orders['customer_id'].to_numpy() == customer_id]
+        single_customer_order_ids = set(single_customer_orders['order_id'].to_numpy())
+        single_customer_payments = self.payments[self.payments['order_id'].isin(single_customer_order_ids)]
         
         rfm_analyzer = RFMAnalyzer()
         rfm_df = rfm_analyzer.calculate_rfm(single_customer_orders, single_customer_payments)
@@ -493,6 +526,93 @@ class TestEndToEndWorkflow(unittest.TestCase):
         shutil.rmtree(self.test_dir)
 
 
+class TestDataValidation(unittest.TestCase):
+    """Test data validation rules"""
+    
+    def test_pattern_accented_text(self):
+        """Test that Unicode word/digit classes accept Portuguese text and non-ASCII digits"""
+        cities = pd.DataFrame({'customer_city': ['são paulo', 'brasília', 'maceió', 'niterói']})
+        result = DataValidator().add_pattern('customer_city', r'^\w+( \w+)*$').validate(cities)
+        self.assertTrue(result.is_valid, result.errors)
+        
+        digits = pd.DataFrame({'code': ['١٢', '42']})
+        result = DataValidator().add_pattern('code', r'^\d+$').validate(digits)
+        self.assertTrue(result.is_valid, result.errors)
+    
+    def test_pattern_trailing_newline(self):
+        """Test that $ still matches before a trailing newline, as in Python re"""
+        rule = PatternRule('name', r'^abc$')
+        result = rule.validate(pd.DataFrame({'name': ['abc', 'abc\n', 'abd']}))
+        self.assertEqual(result.metrics['name_pattern_non_matches'], 1)
+    
+    def test_pattern_posix_class(self):
+        """Test that [[:digit:]] keeps its Python re meaning (a set of ':[dgit' then ']') rather than RE2's"""
+        with warnings.catch_warnings():
+            # Python re warns about the nested-set lookalike
+            warnings.simplefilter('ignore', FutureWarning)
+            rule = PatternRule('code', r'[[:digit:]]+')
+            result = rule.validate(pd.DataFrame({'code': ['12', 'd]', 'a:']}))
+            self.assertEqual(result.metrics['code_pattern_non_matches'], 2)
+            
+            rule = PatternRule('code', r'[[:alpha:]]:')
+            result = rule.validate(pd.DataFrame({'code': ['a:']}))
+            self.assertEqual(result.metrics['code_pattern_non_matches'], 1)
+    
+    def test_failing_rule_keeps_other_results(self):
+        """Test that a rule raising in one column group doesn't discard the other groups' findings"""
+        class ExplodingRule(PatternRule):
+            def validate_cached(self, ctx, result=None):
+                raise RuntimeError("boom")
+        
+        df = pd.DataFrame({'a': [1, None], 'b': [None, 2], 'c': ['x', 'y']})
+        validator = DataValidator().add_not_null('a').add_rule(ExplodingRule('c', 'x')).add_not_null('b')
+        result = validator.validate(df)
+        
+        self.assertFalse(result.is_valid)
+        self.assertEqual(len(result.errors), 3)
+        self.assertIn('Column a', result.errors[0])
+        self.assertIn('Column b', result.errors[1])
+        self.assertIn('Validation process failed: boom', result.errors[2])
+        self.assertIn('b_null_count', result.metrics)
+    
+    def test_error_cap_is_per_rule(self):
+        """Test that the error sample cap applies per rule and never drops a process failure"""
+        class ExplodingRule(PatternRule):
+            def validate_cached(self, ctx, result=None):
+                raise RuntimeError("boom")
+        
+        n_columns = ValidationResult.MAX_SAMPLE_ERRORS + 2
+        df = pd.DataFrame({f'col_{i}': [None] for i in range(n_columns)})
+        df['text'] = ['x']
+        validator = DataValidator()
+        for i in range(n_columns):
+            validator.add_not_null(f'col_{i}')
+        result = validator.add_rule(ExplodingRule('text', 'x')).validate(df)
+        
+        self.assertEqual(len(result.errors), n_columns + 1)
+        self.assertIn('Validation process failed: boom', result.errors[-1])
+        self.assertNotIn('truncated_errors', result.metrics)
+        
+        with self.assertRaises(TypeError):
+            ValidationResult(True, _rule_start=5)
+    
+    def test_range_metrics_keep_column_types(self):
+        """Test that range min/max report the column's own value types, not floats"""
+        df = pd.DataFrame({
+            'qty': pd.Series([1, None, 7], dtype='Int64'),
+            'flag': [True, False, True],
+            'count': [3, 1, 2]
+        })
+        metrics = {}
+        for col in df.columns:
+            metrics.update(RangeRule(col, 0).validate(df).metrics)
+        
+        self.assertEqual((metrics['qty_min'], metrics['qty_max']), (1, 7))
+        self.assertIsInstance(metrics['qty_max'], np.integer)
+        self.assertIsInstance(metrics['flag_max'], np.bool_)
+        self.assertIsInstance(metrics['count_min'], np.integer)
+
+
 class TestErrorHandling(unittest.TestCase):
     """Test error handling and edge cases"""
     
@@ -558,7 +678,18 @@ class TestErrorHandling(unittest.TestCase):
         self.assertIsInstance(rfm_df, pd.DataFrame)
 
 
-def run_all_tests():
+def _run_test_class(class_name):
+    """Run one TestCase class in a worker process, returning picklable results and its report"""
+    stream = io.StringIO()
+    tests = unittest.TestLoader().loadTestsFromTestCase(globals()[class_name])
+    result = unittest.TextTestRunner(stream=stream, verbosity=2).run(tests)
+    return (result.testsRun,
+            [(str(test), trace) for test, trace in result.failures],
+            [(str(test), trace) for test, trace in result.errors],
+            stream.getvalue())
+
+
+def run_all_tests(parallel=True):
     """Run all test suites"""
     
     # Create test suite
@@ -568,18 +699,31 @@ def run_all_tests():
         TestLTVModeling,
         TestAdvancedAnalysis,
         TestEndToEndWorkflow,
+        TestDataValidation,
         TestErrorHandling
     ]
     
-    suite = unittest.TestSuite()
-    
-    for test_class in test_classes:
-        tests = unittest.TestLoader().loadTestsFromTestCase(test_class)
-        suite.addTests(tests)
-    
-    # Run tests
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
+    if parallel:
+        # The classes are independent, so each runs in its own process; reports print in class order
+        result = unittest.TestResult()
+        max_workers = min(len(test_classes), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            for tests_run, failures, errors, report in executor.map(_run_test_class,
+                                                                     [cls.__name__ for cls in test_classes]):
+                sys.stderr.write(report)
+                result.testsRun += tests_run
+                result.failures.extend(failures)
+                result.errors.extend(errors)
+    else:
+        suite = unittest.TestSuite()
+        
+        for test_class in test_classes:
+            tests = unittest.TestLoader().loadTestsFromTestCase(test_class)
+            suite.addTests(tests)
+        
+        # Run tests
+        runner = unittest.TextTestRunner(verbosity=2)
+        result = runner.run(suite)
     
     # Print summary
     print("\n" + "="*80)
@@ -606,7 +750,15 @@ def run_all_tests():
 if __name__ == '__main__':
     print("🧪 Starting Comprehensive Olist Analytics Test Suite")
     print("="*80)
-    result = run_all_tests()
+    
+    if XDIST_AVAILABLE:
+        import pytest
+        
+        # loadscope keeps each TestCase on one worker, so a class's shared fixtures build on that worker only
+        sys.exit(pytest.main([__file__, '-n', 'auto', '--dist=loadscope', '-q']))
+    
+    # --single runs every class serially in this process
+    result = run_all_tests(parallel='--single' not in sys.argv)
     
     # Exit with appropriate code
     if result.failures or result.errors: